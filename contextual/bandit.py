@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 import numpy as np
 
 class ContextualBanditArm(ABC):
+    __slots__ = ()
     def fix_probabilistic_state(self, context: np.ndarray) -> None:
         pass
     def pull(self) -> float:
@@ -48,20 +49,24 @@ class GaussianLinearBandit(Bandit):
         return self.rewards[n]
 
 class SinusoidalBandit(Bandit):
-    # mu(a | x) = sin(x_1) * ... * sin(x_n)
-    def __init__(self, dim: int, amplitude: float) -> None:
+    # mu(a | x) = amplitude * sin(x_1) * ... * sin(x_n), the same for
+    # every arm, each arm gets its own gaussian noise with variance 1
+    def __init__(self, dim: int, amplitude: float, num_arms: int) -> None:
         self.dim = dim
         self.amplitude = amplitude
+        self.num_arms = num_arms
 
     def fix_probabilistic_state(self, context: List[float]) -> None:
-        means = np.product(np.sin(context))
-        self.rewards = np.random.normal(means, np.ones(len(means)))
+        mean = self.amplitude * np.prod(np.sin(context))
+        self.rewards = np.random.normal(mean, np.ones(self.num_arms))
 
     def pull_arm(self, n: int) -> float:
         return self.rewards[n]
     
 
 class GaussianLinearBanditArm(ContextualBanditArm):
+    __slots__ = ("theta", "sigma", "reward")
+
     # mu(a | x) = x * theta
     # a, x, theta are vectors
     # we will also assume a is distributed gaussian with variance 1
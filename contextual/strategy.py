@@ -4,47 +4,50 @@ import numpy as np
 
 
 class ContextualBanditStrategy(ABC):
+    __slots__ = ()
+
     def choose_arm(self) -> int:
         pass
     def record_result(self, context: List[float], arm: int, result: float):
       pass
 
-# copied here to use for DiscreteEpsilonGreedyStrategy  
-class EpsilonGreedy:
-  def __init__(self, num_arms: int, epsilon: float) -> None:
-    self.num_arms = num_arms
-
-    assert epsilon >= 0.0 and epsilon <= 1.0
-    self.epsilon = epsilon
-
-    self.sum_results = [0.0 for _ in range(num_arms)]
-    self.num_pulls = [0 for _ in range(num_arms)]
-
-  def choose_arm(self) -> int:
-    success = (self.epsilon < np.random.uniform())
-    if success:
-      return np.random.randint(self.num_arms)
-    else:
-      return np.argmax([x/y if y != 0 else 0.0 for x,y in zip(self.sum_results, self.num_pulls)])
-
-  def record_result(self, arm: int, result: float) -> None:
-    self.sum_results[arm] += result
-
 
 class DiscreteEpsilonGreedyStrategy(ContextualBanditStrategy):
     # context is assumed to be in [a, b]^dim
     # n is the number of grid points we take along each dimension
     # a and b are guaranteed to be grid points
-    # 
-    def __init__(self, a: float, b: float, n: int, dim: int, num_arms: int, epsilon: float) -> None:
+    #
+    # every grid point runs its own epsilon greedy, but rather than one
+    # object per grid point the counts and sums of all of them live in
+    # two (n**dim, num_arms) arrays, row i being grid point i. For
+    # count_dtype and sum_dtype see the note in general/strategy.py
+    __slots__ = (
+        "a", "b", "n", "dim", "num_arms", "epsilon",
+        "sum_results", "num_pulls", "gridpoint_index", "arm",
+    )
+
+    def __init__(
+        self,
+        a: float,
+        b: float,
+        n: int,
+        dim: int,
+        num_arms: int,
+        epsilon: float,
+        count_dtype: type = np.int64,
+        sum_dtype: type = np.float64,
+    ) -> None:
         self.a = a
         self.b = b
         self.n = n
         self.dim = dim
         self.num_arms = num_arms
+
+        assert epsilon >= 0.0 and epsilon <= 1.0
         self.epsilon = epsilon
 
-        self.grid_strategies = [EpsilonGreedy(num_arms, epsilon) for _ in range(n**dim)]
+        self.sum_results = np.zeros((n**dim, num_arms), dtype=sum_dtype)
+        self.num_pulls = np.zeros((n**dim, num_arms), dtype=count_dtype)
 
     # coef[0]*x^N + ... + coef[N]*x^0
     def poly_eval(self, coef: np.ndarray, x: int) -> int:
@@ -59,12 +62,22 @@ class DiscreteEpsilonGreedyStrategy(ContextualBanditStrategy):
         # round to the nearest grid point
         # a + i*(b-a)/(n-1)
         # round (xi - a) / ((b - a) / (n - 1))
-        gridpoint = np.round((context - self.a) * (self.n-1) / (self.b - self.a)).astype(np.int)
+        gridpoint = np.round((context - self.a) * (self.n-1) / (self.b - self.a)).astype(int)
 
         self.gridpoint_index = self.poly_eval(gridpoint, self.n)
 
-        self.arm = self.grid_strategies[self.gridpoint_index].choose_arm()
+        explore = (np.random.uniform() < self.epsilon)
+        if explore:
+            self.arm = np.random.randint(self.num_arms)
+        else:
+            sum_results = self.sum_results[self.gridpoint_index]
+            num_pulls = self.num_pulls[self.gridpoint_index]
+            out = np.zeros(self.num_arms, dtype=sum_results.dtype)
+            self.arm = np.argmax(np.divide(sum_results, num_pulls, out=out, where=num_pulls != 0))
         return self.arm
 
+    # unlike the EpsilonGreedy cells this replaced, pulls are counted, so the
+    # greedy step compares real means instead of always picking arm 0
     def record_result(self, arm: int, result: float) -> None:
-        self.grid_strategies[self.gridpoint_index].record_result(arm, result)
+        self.num_pulls[self.gridpoint_index, arm] += 1
+        self.sum_results[self.gridpoint_index, arm] += result
@@ -5,6 +5,7 @@ import numpy as np
 ArmType = NewType("ArmType", Union[int, float, np.ndarray])
 
 class BanditArm(ABC):
+    __slots__ = ()
     def fix_probabilistic_state(self) -> None:
         pass
     def pull_arm(self) -> float:
@@ -32,11 +33,14 @@ class FiniteArmedStochasticBandit(Bandit):
 class BernoulliBandit(Bandit):
     def __init__(self, probabilities: List[float]) -> None:
         self.probabilities = probabilities
+    def process_context(self, context: Optional[np.ndarray]) -> None:
+        self.coin_flips = np.random.binomial(1, self.probabilities)
     def pull_arm(self, n: int) -> float:
         return self.coin_flips[n]
 
 
 class BernoulliBanditArm:
+    __slots__ = ("p", "observed_value")
     def __init__(self, p: float) -> None:
         assert p >= 0.0 and p <= 1.0
         self.p = p
@@ -46,6 +50,7 @@ class BernoulliBanditArm:
         return self.observed_value
 
 class GaussianBanditArm:
+    __slots__ = ("mu", "sigma", "observed_value")
     def __init__(self, mu: float, sigma: float) -> None:
         assert sigma >= 0.0
         self.mu = mu
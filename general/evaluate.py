@@ -0,0 +1,213 @@
+import os
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from strategy import Strategy
+
+# Off-policy evaluation of a strategy on logged bandit data.
+#
+# Logs are stored column by column, one .npy file per column in a
+# directory, so they can be memory mapped and streamed in chunks:
+#   arm.npy         (N,)    int, the arm the logging policy pulled
+#   propensity.npy  (N,)    float, probability the logging policy pulled it
+#   reward.npy      (N,)    float, the observed reward
+#   context.npy     (N, d)  float, optional, only for contextual logs
+#
+# Three estimators of the strategy's mean reward per round are kept:
+#   replay - mean reward over the rounds where the strategy agrees with
+#            the log (Li et al. 2011). Needs uniform logging to be unbiased
+#   ips    - inverse propensity scoring, 1[a = pi(x)] * r / p
+#   dr     - doubly robust, r_hat(pi(x)) + 1[a = pi(x)] * (r - r_hat(a)) / p
+#            where r_hat is the running mean reward of each arm in the log
+#
+# The strategy only learns from the rounds that match the log, since
+# those are the only rounds where we know what it would have seen.
+
+LOG_COLUMNS = ["arm", "propensity", "reward", "context"]
+ESTIMATORS = ["replay", "ips", "dr"]
+
+
+def save_logs(
+    path: str,
+    arms: np.ndarray,
+    propensities: np.ndarray,
+    rewards: np.ndarray,
+    contexts: Optional[np.ndarray] = None,
+) -> None:
+    assert len(arms) == len(propensities) == len(rewards)
+    propensities = np.asarray(propensities, dtype=np.float64)
+    assert np.all((propensities > 0.0) & (propensities <= 1.0)), "propensities must be in (0, 1]"
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, "arm.npy"), np.asarray(arms, dtype=np.int64))
+    np.save(os.path.join(path, "propensity.npy"), propensities)
+    np.save(os.path.join(path, "reward.npy"), np.asarray(rewards, dtype=np.float64))
+    if contexts is not None:
+        assert len(contexts) == len(arms)
+        np.save(os.path.join(path, "context.npy"), np.asarray(contexts, dtype=np.float64))
+
+
+def load_logs(path: str) -> Dict[str, np.ndarray]:
+    # memory mapped, nothing is read until a chunk is sliced out
+    logs = {}
+    for column in LOG_COLUMNS:
+        filename = os.path.join(path, column + ".npy")
+        if os.path.exists(filename):
+            logs[column] = np.load(filename, mmap_mode="r")
+    return logs
+
+
+def iter_chunks(
+    logs: Dict[str, np.ndarray],
+    chunk_size: int,
+    start: int = 0,
+    stop: Optional[int] = None,
+    columns: Optional[List[str]] = None,
+) -> Iterator[Dict[str, np.ndarray]]:
+    # only the given columns are read, all of them by default
+    if stop is None:
+        stop = len(logs["arm"])
+    if columns is None:
+        columns = list(logs)
+    for i in range(start, stop, chunk_size):
+        j = min(i + chunk_size, stop)
+        yield {column: np.asarray(logs[column][i:j]) for column in columns}
+
+
+class OnlineMoments:
+    # running mean and variance (Welford), batches and workers are
+    # combined with the pairwise update of Chan et al.
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def merge(self, n: int, mean: float, m2: float) -> None:
+        if n == 0:
+            return
+        total = self.n + n
+        delta = mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += m2 + delta**2 * self.n * n / total
+        self.n = total
+
+    def add_batch(self, x: np.ndarray) -> None:
+        if len(x) == 0:
+            return
+        mean = np.mean(x)
+        self.merge(len(x), mean, np.sum((x - mean)**2))
+
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def standard_error(self) -> float:
+        return np.sqrt(self.variance() / self.n) if self.n > 0 else 0.0
+
+
+def evaluate(
+    strat: Strategy,
+    logs: Dict[str, np.ndarray],
+    num_arms: int,
+    chunk_size: int = 65536,
+    contextual: bool = False,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Dict[str, OnlineMoments]:
+    # contextual strategies (eg DiscreteEpsilonGreedyStrategy) are given the
+    # logged context in choose_arm, the others are called without arguments
+    if contextual:
+        assert "context" in logs, "contextual evaluation needs a context column (context.npy) in the logs"
+
+    # the (N, d) context column is only read when the strategy uses it
+    columns = ["arm", "propensity", "reward"]
+    if contextual:
+        columns.append("context")
+
+    estimates = {name: OnlineMoments() for name in ESTIMATORS}
+    reward_sums = np.zeros(num_arms)
+    reward_counts = np.zeros(num_arms)
+
+    for chunk in iter_chunks(logs, chunk_size, start, stop, columns):
+        arms = chunk["arm"]
+        propensities = chunk["propensity"]
+        rewards = chunk["reward"]
+        contexts = chunk.get("context")
+        # a single zero propensity would turn ips and dr into inf or nan for
+        # the whole run
+        assert np.all((propensities > 0.0) & (propensities <= 1.0)), "propensities must be in (0, 1]"
+
+        choices = np.empty(len(arms), dtype=np.int64)
+        r_hat_choice = np.empty(len(arms))
+        r_hat_logged = np.empty(len(arms))
+
+        for t in range(len(arms)):
+            if contextual:
+                choice = strat.choose_arm(contexts[t])
+            else:
+                choice = strat.choose_arm()
+            arm = arms[t]
+
+            choices[t] = choice
+            if reward_counts[choice] > 0:
+                r_hat_choice[t] = reward_sums[choice] / reward_counts[choice]
+            else:
+                r_hat_choice[t] = 0.0
+            if reward_counts[arm] > 0:
+                r_hat_logged[t] = reward_sums[arm] / reward_counts[arm]
+            else:
+                r_hat_logged[t] = 0.0
+
+            if choice == arm:
+                strat.record_result(arm, rewards[t])
+            reward_sums[arm] += rewards[t]
+            reward_counts[arm] += 1
+
+        match = choices == arms
+        weighted = match * (rewards - r_hat_logged) / propensities
+        estimates["replay"].add_batch(rewards[match])
+        estimates["ips"].add_batch(match * rewards / propensities)
+        estimates["dr"].add_batch(r_hat_choice + weighted)
+
+    return estimates
+
+
+def _evaluate_shard(args: Tuple) -> Dict[str, Tuple[int, float, float]]:
+    make_strategy, path, num_arms, chunk_size, contextual, start, stop, seed = args
+    # forked workers inherit the parent's random state, reseed so every
+    # shard explores with its own stream
+    np.random.seed(seed.generate_state(1)[0])
+    logs = load_logs(path)
+    estimates = evaluate(make_strategy(), logs, num_arms, chunk_size, contextual, start, stop)
+    return {name: (m.n, m.mean, m.m2) for name, m in estimates.items()}
+
+
+def evaluate_parallel(
+    make_strategy: Callable[[], Strategy],
+    path: str,
+    num_arms: int,
+    num_processes: int,
+    chunk_size: int = 65536,
+    contextual: bool = False,
+    seed: Optional[int] = None,
+) -> Dict[str, OnlineMoments]:
+    # the log is cut into num_processes contiguous shards and every shard is
+    # evaluated by a fresh strategy from make_strategy (which must be
+    # picklable, eg a module level function or functools.partial). A
+    # learning strategy therefore only sees its own shard. The shards get
+    # independent random streams spawned from seed.
+
+    num_rows = len(load_logs(path)["arm"])
+    bounds = np.linspace(0, num_rows, num_processes + 1).astype(int)
+    seeds = np.random.SeedSequence(seed).spawn(num_processes)
+    shards = [
+        (make_strategy, path, num_arms, chunk_size, contextual, bounds[i], bounds[i+1], seeds[i])
+        for i in range(num_processes)
+    ]
+
+    with Pool(num_processes) as pool:
+        shard_estimates = pool.map(_evaluate_shard, shards)
+
+    estimates = {name: OnlineMoments() for name in ESTIMATORS}
+    for shard in shard_estimates:
+        for name, moments in shard.items():
+            estimates[name].merge(*moments)
+    return estimates
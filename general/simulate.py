@@ -1,7 +1,7 @@
 from bandit import *
 from strategy import *
 import numpy as np
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 
 def simulate(
     strats: List[Strategy],
@@ -32,5 +32,78 @@ def simulate(
                 
     return results
 
+# each round every strategy shows a slate of k arms; the reward of every
+# position is recorded, so results[j, i, p] is what strategy j got in
+# round i from the arm it put at position p
+def simulate_slate(
+    strats: List[Strategy],
+    bandit: Bandit,
+    context_generator: Optional[Callable[[], np.ndarray]],
+    num_rounds: int,
+    k: int,
+) -> np.ndarray:
+
+    for strat in strats:
+        if type(strat).choose_arms_topk is Strategy.choose_arms_topk:
+            raise NotImplementedError(type(strat).__name__ + " does not support slates")
+
+    results = np.empty((len(strats), num_rounds, k))
+
+    for i in range(num_rounds):
+
+        if context_generator is not None:
+            context = context_generator()
+        else:
+            context = None
+        bandit.process_context(context)
+
+        for j, strat in enumerate(strats):
+            arms = strat.choose_arms_topk(k)
+            for p, arm in enumerate(arms):
+                bandit.process_arm(arm)
+                result = bandit.pull_arm(arm)
+                results[j, i, p] = result
+                strat.record_result(arm, result)
+
+    return results
+
+# for BestArmIdentification strategies: every strategy is run until it
+# is done, or for at most max_rounds. Returns the recommended arm of each
+# strategy (-1 if it did not finish) and the number of rounds it took,
+# ie its sample complexity
+def simulate_best_arm_identification(
+    strats: List[BestArmIdentification],
+    bandit: Bandit,
+    context_generator: Optional[Callable[[], np.ndarray]],
+    max_rounds: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+
+    best_arms = np.full(len(strats), -1)
+    num_rounds = np.full(len(strats), max_rounds)
+
+    for i in range(max_rounds):
+
+        if context_generator is not None:
+            context = context_generator()
+        else:
+            context = None
+        bandit.process_context(context)
+
+        for j, strat in enumerate(strats):
+            if strat.is_done():
+                continue
+            arm = strat.choose_arm()
+            bandit.process_arm(arm)
+            result = bandit.pull_arm(arm)
+            strat.record_result(arm, result)
+            if strat.is_done():
+                best_arms[j] = strat.best_arm
+                num_rounds[j] = i + 1
+
+        if all(strat.is_done() for strat in strats):
+            break
+
+    return best_arms, num_rounds
+
 results = simulate([ThompsonSamplingBeta(2)], BernoulliBandit([0.1, 0.9]), None, 10)
 print(results)
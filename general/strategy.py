@@ -3,15 +3,31 @@ from typing import List
 import numpy as np
 from distributions import ConjugateDistributions
 
+# indices of the k largest values, best first. argpartition does the
+# selection in O(K), so only the k chosen values get sorted
+def top_k(values: np.ndarray, k: int) -> np.ndarray:
+  values = np.asarray(values)
+  assert k >= 1 and k <= len(values)
+  top = np.argpartition(-values, k - 1)[:k]
+  return top[np.argsort(-values[top])]
+
 class Strategy(ABC):
+  __slots__ = ()
+
   def choose_arm(self) -> int:
     pass
+
+  # slate of k distinct arms, best first
+  def choose_arms_topk(self, k: int) -> np.ndarray:
+    raise NotImplementedError(type(self).__name__ + " does not support slates")
   
   def record_result(self, arm: int, result: float) -> None:
     pass
 
 
 class UniformExploration(Strategy):
+  __slots__ = ("num_arms", "num_times_explore", "num_rounds_so_far", "sum_results", "best_arm")
+
   def __init__(self, num_arms: int, num_times_explore: int) -> None:
     self.num_arms = num_arms
     self.num_times_explore = num_times_explore
@@ -31,33 +47,65 @@ class UniformExploration(Strategy):
     if self.num_rounds_so_far == self.num_times_explore * self.num_arms:
       self.best_arm = np.argmax(self.sum_results)
 
+# EpsilonGreedy, UCB (and the stochastic/ and contextual/ strategies that
+# take the same arguments) keep their counts and sums in arrays of
+# count_dtype and sum_dtype. np.int32 and np.float32 halve the per arm
+# state, but float32 sums stop growing under unit rewards past 2**24
+# pulls and int32 counts overflow at 2**31.
 class EpsilonGreedy(Strategy):
-  def __init__(self, num_arms: int, epsilon: float) -> None:
+  __slots__ = ("num_arms", "epsilon", "sum_results", "num_pulls")
+
+  def __init__(
+    self,
+    num_arms: int,
+    epsilon: float,
+    count_dtype: type = np.int64,
+    sum_dtype: type = np.float64,
+  ) -> None:
     self.num_arms = num_arms
 
     assert epsilon >= 0.0 and epsilon <= 1.0
     self.epsilon = epsilon
 
-    self.sum_results = [0.0 for _ in range(num_arms)]
-    self.num_pulls = [0 for _ in range(num_arms)]
+    self.sum_results = np.zeros(num_arms, dtype=sum_dtype)
+    self.num_pulls = np.zeros(num_arms, dtype=count_dtype)
+
+  def means(self) -> np.ndarray:
+    out = np.zeros(self.num_arms, dtype=self.sum_results.dtype)
+    return np.divide(self.sum_results, self.num_pulls, out=out, where=self.num_pulls != 0)
 
   def choose_arm(self) -> int:
-    success = (self.epsilon < np.random.uniform())
-    if success:
+    explore = (np.random.uniform() < self.epsilon)
+    if explore:
       return np.random.randint(self.num_arms)
     else:
-      return np.argmax([x/y if y != 0 else 0.0 for x,y in zip(self.sum_results, self.num_pulls)])
+      return np.argmax(self.means())
+
+  def choose_arms_topk(self, k: int) -> np.ndarray:
+    explore = (np.random.uniform() < self.epsilon)
+    if explore:
+      return np.random.choice(self.num_arms, k, replace=False)
+    else:
+      return top_k(self.means(), k)
 
   def record_result(self, arm: int, result: float) -> None:
+    self.num_pulls[arm] += 1
     self.sum_results[arm] += result
     
 
 class UCB(Strategy):
-  def __init__(self, num_arms: int) -> None:
+  __slots__ = ("num_arms", "num_rounds_so_far", "num_pulls", "sum_results")
+
+  def __init__(
+    self,
+    num_arms: int,
+    count_dtype: type = np.int64,
+    sum_dtype: type = np.float64,
+  ) -> None:
     self.num_arms = num_arms
     self.num_rounds_so_far = 0
-    self.num_pulls = np.array([0 for _ in range(num_arms)])
-    self.sum_results = np.array([0 for _ in range(num_arms)])
+    self.num_pulls = np.zeros(num_arms, dtype=count_dtype)
+    self.sum_results = np.zeros(num_arms, dtype=sum_dtype)
 
   def choose_arm(self) -> int:
     if self.num_rounds_so_far < self.num_arms:
@@ -68,12 +116,24 @@ class UCB(Strategy):
       r = np.sqrt(2 * np.log(self.num_rounds_so_far) / self.num_pulls)
       return np.argmax(mu + r)
 
+  def choose_arms_topk(self, k: int) -> np.ndarray:
+    # arms not pulled yet get an infinite index so they fill the slate first
+    index = np.full(self.num_arms, np.inf)
+    pulled = self.num_pulls > 0
+    if np.any(pulled):
+      mu = self.sum_results[pulled] / self.num_pulls[pulled]
+      r = np.sqrt(2 * np.log(self.num_rounds_so_far) / self.num_pulls[pulled])
+      index[pulled] = mu + r
+    return top_k(index, k)
+
   def record_result(self, arm: int, result: float) -> None:
     self.num_rounds_so_far += 1
     self.num_pulls[arm] += 1
     self.sum_results[arm] += result
     
 class ThompsonSamplingBeta(Strategy):
+    __slots__ = ("beta_params",)
+
     def __init__(
         self,
         num_arms: int,
@@ -86,6 +146,10 @@ class ThompsonSamplingBeta(Strategy):
         sampled = np.random.beta(*self.beta_params)
         return np.argmax(sampled)
 
+    def choose_arms_topk(self, k: int) -> np.ndarray:
+        sampled = np.random.beta(*self.beta_params)
+        return top_k(sampled, k)
+
     def record_result(self, arm: int, result: float) -> None:
         if result > 0.5:
             self.beta_params[0][arm] += 1.0
@@ -93,6 +157,8 @@ class ThompsonSamplingBeta(Strategy):
             self.beta_params[1][arm] += 1.0
         
 class ThompsonSamplingConjugateDistributions(Strategy):
+    __slots__ = ("conj_dists",)
+
     def __init__(
         self,
         num_arms: int,
@@ -104,11 +170,17 @@ class ThompsonSamplingConjugateDistributions(Strategy):
       sampled = [conj_dist.likelihood_mean_sample_prior() for conj_dist in self.conj_dists]
       return np.argmax(sampled)
 
+    def choose_arms_topk(self, k: int) -> np.ndarray:
+      sampled = [conj_dist.likelihood_mean_sample_prior() for conj_dist in self.conj_dists]
+      return top_k(sampled, k)
+
     def record_result(self, arm: int, result: float) -> None:
       self.conj_dists[arm].update_prior(result)
         
 
 class ThompsonSamplingBootstrap(Strategy):
+  __slots__ = ("num_arms", "num_rounds_so_far", "results")
+
   def __init__(self, num_arms: int) -> None:
     self.num_arms = num_arms
     self.num_rounds_so_far = 0
@@ -126,3 +198,166 @@ class ThompsonSamplingBootstrap(Strategy):
   def record_result(self, arm: int, result: float) -> None:
     self.num_rounds_so_far += 1
     self.results[arm].append(result)
+
+
+# Fixed confidence best arm identification: pull arms until the best one
+# is known with probability at least 1 - delta, then stop. is_done()
+# tells the simulator to stop and best_arm is the recommendation.
+# Rewards are assumed to be in [0, 1], or sigma sub-gaussian for
+# TrackAndStop.
+class BestArmIdentification(Strategy):
+  __slots__ = ("num_arms", "delta", "num_rounds_so_far", "num_pulls", "sum_results", "best_arm")
+
+  def __init__(self, num_arms: int, delta: float) -> None:
+    assert num_arms >= 2
+    assert delta > 0.0 and delta < 1.0
+    self.num_arms = num_arms
+    self.delta = delta
+    self.num_rounds_so_far = 0
+    self.num_pulls = np.zeros(num_arms, dtype=np.int64)
+    self.sum_results = np.zeros(num_arms)
+    self.best_arm = None
+
+  def is_done(self) -> bool:
+    return self.best_arm is not None
+
+  def means(self) -> np.ndarray:
+    return np.divide(self.sum_results, self.num_pulls, out=np.zeros(self.num_arms), where=self.num_pulls != 0)
+
+  def record_result(self, arm: int, result: float) -> None:
+    self.num_rounds_so_far += 1
+    self.num_pulls[arm] += 1
+    self.sum_results[arm] += result
+
+class SuccessiveElimination(BestArmIdentification):
+  # Even-Dar et al. 2006. Active arms are pulled round robin, after every
+  # sweep the arms whose upper confidence bound is below the best lower
+  # confidence bound are dropped from the active set
+  __slots__ = ("active", "position")
+
+  def __init__(self, num_arms: int, delta: float) -> None:
+    super().__init__(num_arms, delta)
+    self.active = np.arange(num_arms)
+    self.position = 0
+
+  def choose_arm(self) -> int:
+    if self.is_done():
+      return self.best_arm
+    return self.active[self.position]
+
+  def record_result(self, arm: int, result: float) -> None:
+    # the sweep only works if arms are recorded in the order chosen
+    if not self.is_done():
+      assert arm == self.active[self.position], "expected a result for arm %d" % self.active[self.position]
+    super().record_result(arm, result)
+    if self.is_done():
+      return
+    self.position += 1
+    if self.position < len(self.active):
+      return
+
+    # every active arm has been pulled the same number of times
+    self.position = 0
+    n = self.num_pulls[self.active[0]]
+    r = np.sqrt(np.log(4 * self.num_arms * n**2 / self.delta) / (2 * n))
+    mu = self.sum_results[self.active] / n
+    self.active = self.active[mu + r >= np.max(mu) - r]
+    if len(self.active) == 1:
+      self.best_arm = self.active[0]
+
+class LUCB(BestArmIdentification):
+  # LUCB1 of Kalyanakrishnan et al. 2012. Every round pulls both the
+  # empirical best arm and its strongest challenger, and stops once the
+  # lower bound of the former clears the upper bound of the latter
+  __slots__ = ("pending",)
+
+  def __init__(self, num_arms: int, delta: float) -> None:
+    super().__init__(num_arms, delta)
+    self.pending = list(range(num_arms))
+
+  def choose_arm(self) -> int:
+    if self.is_done():
+      return self.best_arm
+    return self.pending[0]
+
+  def record_result(self, arm: int, result: float) -> None:
+    if not self.is_done():
+      assert arm == self.pending[0], "expected a result for arm %d" % self.pending[0]
+    super().record_result(arm, result)
+    if self.is_done():
+      return
+    self.pending.pop(0)
+    if self.pending:
+      return
+
+    t = self.num_rounds_so_far
+    mu = self.means()
+    r = np.sqrt(np.log(5 * self.num_arms * t**4 / (4 * self.delta)) / (2 * self.num_pulls))
+    h = np.argmax(mu)
+    ucb = mu + r
+    ucb[h] = -np.inf
+    l = np.argmax(ucb)
+    if mu[h] - r[h] > ucb[l]:
+      self.best_arm = h
+    else:
+      self.pending = [h, l]
+
+class TrackAndStop(BestArmIdentification):
+  # Garivier and Kaufmann 2016, for gaussian rewards with known sigma.
+  # The arms are pulled so their proportions track the optimal weights
+  # w*(mu) of the empirical means (D-tracking), and the run stops when
+  # the generalized likelihood ratio against every other arm exceeds
+  # log((log(t) + 1) / delta)
+  __slots__ = ("sigma",)
+
+  def __init__(self, num_arms: int, delta: float, sigma: float = 0.5) -> None:
+    super().__init__(num_arms, delta)
+    assert sigma > 0.0
+    self.sigma = sigma
+
+  def optimal_weights(self, mu: np.ndarray) -> np.ndarray:
+    best = np.argmax(mu)
+    others = np.arange(self.num_arms) != best
+    # c_a = KL(mu_best, mu_a). For gaussians x_a(y) = y / (c_a - y) and the
+    # equation for y is sum_a x_a(y)^2 = 1, solved by bisection on [0, min c_a)
+    c = (mu[best] - mu[others])**2 / (2 * self.sigma**2)
+    if np.min(c) <= 0.0:
+      return np.full(self.num_arms, 1.0 / self.num_arms)
+    lo, hi = 0.0, np.min(c)
+    for _ in range(50):
+      y = (lo + hi) / 2
+      if np.sum((y / (c - y))**2) > 1.0:
+        hi = y
+      else:
+        lo = y
+    x = lo / (c - lo)
+    w = np.empty(self.num_arms)
+    w[best] = 1.0
+    w[others] = x
+    return w / np.sum(w)
+
+  def choose_arm(self) -> int:
+    if self.is_done():
+      return self.best_arm
+    t = self.num_rounds_so_far
+    if t < self.num_arms:
+      return t
+    # forced exploration keeps every arm at about sqrt(t) pulls
+    if np.min(self.num_pulls) < np.sqrt(t) - self.num_arms / 2:
+      return np.argmin(self.num_pulls)
+    w = self.optimal_weights(self.means())
+    return np.argmax(t * w - self.num_pulls)
+
+  def record_result(self, arm: int, result: float) -> None:
+    super().record_result(arm, result)
+    t = self.num_rounds_so_far
+    if self.is_done() or t < self.num_arms:
+      return
+
+    mu = self.means()
+    best = np.argmax(mu)
+    others = np.arange(self.num_arms) != best
+    n_best, n = self.num_pulls[best], self.num_pulls[others]
+    z = n_best * n / (n_best + n) * (mu[best] - mu[others])**2 / (2 * self.sigma**2)
+    if np.min(z) > np.log((np.log(t) + 1) / self.delta):
+      self.best_arm = best
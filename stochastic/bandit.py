@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 import numpy as np
 
 class StochasticBanditArm(ABC):
+    __slots__ = ()
     def fix_probabilistic_state(self) -> None:
         pass
     def pull(self) -> float:
@@ -41,6 +42,7 @@ class BernoulliBandit(StochasticBandit):
 
 
 class GaussianStochasticBanditArm:
+    __slots__ = ("mu", "sigma", "observed_value")
     def __init__(self, mu: float, sigma: float) -> None:
         assert sigma >= 0.0
         self.mu = mu
@@ -47,7 +47,8 @@ class NormalGammaNormal(ConjugateDistributions):
     # https://people.eecs.berkeley.edu/~jordan/courses/260-spring10/lectures/lecture5.pdf
     
     def __init__(self, prior_params: List[float]) -> None:
-        # params: mu_0, n_0_tau, alpha, beta
+        # params: mu_0, n_0, alpha, beta
+        # mu | tau ~ N(mu_0, 1/(n_0 tau)), tau ~ Gamma(alpha, rate=beta)
         self.prior_params = prior_params
 
     def update_prior(self, x: float) -> None:
@@ -59,12 +60,12 @@ class NormalGammaNormal(ConjugateDistributions):
         n_0 += 1
         mu_0 += 1/n_0 * (x - mu_0)
 
-        self.prior_params = mu_0, n_0_tau, alpha, beta
+        self.prior_params = mu_0, n_0, alpha, beta
 
     def likelihood_mean_sample_prior(self) -> float:
         mu_0, n_0, alpha, beta = self.prior_params
 
         tau = np.random.gamma(alpha, 1/beta)
-        mu = np.random.normal(mu_0, np.sqrt(n_0 * tau))
+        mu = np.random.normal(mu_0, 1/np.sqrt(n_0 * tau))
 
         return mu
@@ -5,6 +5,8 @@ from distributions import ConjugateDistributions
 
 
 class StochasticBanditStrategy(ABC):
+  __slots__ = ()
+
   def choose_arm(self) -> int:
     pass
   
@@ -13,6 +15,8 @@ class StochasticBanditStrategy(ABC):
       
 
 class UniformExploration(StochasticBanditStrategy):
+  __slots__ = ("num_arms", "num_times_explore", "num_rounds_so_far", "sum_results", "best_arm")
+
   def __init__(self, num_arms: int, num_times_explore: int) -> None:
     self.num_arms = num_arms
     self.num_times_explore = num_times_explore
@@ -32,33 +36,54 @@ class UniformExploration(StochasticBanditStrategy):
     if self.num_rounds_so_far == self.num_times_explore * self.num_arms:
       self.best_arm = np.argmax(self.sum_results)
 
+# for count_dtype and sum_dtype see the note in general/strategy.py
 class EpsilonGreedy(StochasticBanditStrategy):
-  def __init__(self, num_arms: int, epsilon: float) -> None:
+  __slots__ = ("num_arms", "epsilon", "sum_results", "num_pulls")
+
+  def __init__(
+    self,
+    num_arms: int,
+    epsilon: float,
+    count_dtype: type = np.int64,
+    sum_dtype: type = np.float64,
+  ) -> None:
     self.num_arms = num_arms
 
     assert epsilon >= 0.0 and epsilon <= 1.0
     self.epsilon = epsilon
 
-    self.sum_results = [0.0 for _ in range(num_arms)]
-    self.num_pulls = [0 for _ in range(num_arms)]
+    self.sum_results = np.zeros(num_arms, dtype=sum_dtype)
+    self.num_pulls = np.zeros(num_arms, dtype=count_dtype)
+
+  def means(self) -> np.ndarray:
+    out = np.zeros(self.num_arms, dtype=self.sum_results.dtype)
+    return np.divide(self.sum_results, self.num_pulls, out=out, where=self.num_pulls != 0)
 
   def choose_arm(self) -> int:
-    success = (self.epsilon < np.random.uniform())
-    if success:
+    explore = (np.random.uniform() < self.epsilon)
+    if explore:
       return np.random.randint(self.num_arms)
     else:
-      return np.argmax([x/y if y != 0 else 0.0 for x,y in zip(self.sum_results, self.num_pulls)])
+      return np.argmax(self.means())
 
   def record_result(self, arm: int, result: float) -> None:
+    self.num_pulls[arm] += 1
     self.sum_results[arm] += result
     
 
 class UCB(StochasticBanditStrategy):
-  def __init__(self, num_arms: int) -> None:
+  __slots__ = ("num_arms", "num_rounds_so_far", "num_pulls", "sum_results")
+
+  def __init__(
+    self,
+    num_arms: int,
+    count_dtype: type = np.int64,
+    sum_dtype: type = np.float64,
+  ) -> None:
     self.num_arms = num_arms
     self.num_rounds_so_far = 0
-    self.num_pulls = np.array([0 for _ in range(num_arms)])
-    self.sum_results = np.array([0 for _ in range(num_arms)])
+    self.num_pulls = np.zeros(num_arms, dtype=count_dtype)
+    self.sum_results = np.zeros(num_arms, dtype=sum_dtype)
 
   def choose_arm(self) -> int:
     if self.num_rounds_so_far < self.num_arms:
@@ -75,6 +100,8 @@ class UCB(StochasticBanditStrategy):
     self.sum_results[arm] += result
     
 class ThompsonSamplingBeta(StochasticBanditStrategy):
+    __slots__ = ("beta_params",)
+
     def __init__(
         self,
         num_arms: int,
@@ -94,6 +121,8 @@ class ThompsonSamplingBeta(StochasticBanditStrategy):
             self.beta_params[1][arm] += 1.0
         
 class ThompsonSamplingConjugateDistributions(StochasticBanditStrategy):
+    __slots__ = ("conj_dists",)
+
     def __init__(
         self,
         num_arms: int,
@@ -110,6 +139,8 @@ class ThompsonSamplingConjugateDistributions(StochasticBanditStrategy):
         
 
 class ThompsonSamplingBootstrap(StochasticBanditStrategy):
+  __slots__ = ("num_arms", "num_rounds_so_far", "results")
+
   def __init__(self, num_arms: int) -> None:
     self.num_arms = num_arms
     self.num_rounds_so_far = 0
@@ -0,0 +1,7 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def seed() -> None:
+    np.random.seed(12345)
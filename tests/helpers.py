@@ -0,0 +1,68 @@
+import contextlib
+import importlib
+import io
+import os
+import sys
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# general/, stochastic/ and contextual/ are flat script directories whose
+# modules import each other by bare name (from bandit import *), so the
+# three of them can't be on sys.path at the same time
+FLAT_MODULES = ["bandit", "strategy", "distributions", "simulate", "evaluate"]
+
+_loaded: Dict[str, Dict[str, object]] = {}
+
+
+@contextlib.contextmanager
+def flat_modules(directory: str) -> Iterator[None]:
+    # swaps the modules of one directory into sys.modules for the duration,
+    # eg so that worker processes can unpickle them
+    path = os.path.join(ROOT, directory)
+    saved = {name: sys.modules.pop(name) for name in FLAT_MODULES if name in sys.modules}
+    sys.modules.update(_loaded.get(directory, {}))
+    sys.path.insert(0, path)
+    try:
+        yield
+    finally:
+        sys.path.remove(path)
+        _loaded[directory] = {name: sys.modules.pop(name) for name in FLAT_MODULES if name in sys.modules}
+        sys.modules.update(saved)
+
+
+def load(directory: str, name: str) -> object:
+    with flat_modules(directory):
+        # the simulate scripts run and print an example at import
+        with contextlib.redirect_stdout(io.StringIO()):
+            return importlib.import_module(name)
+
+
+def run_bandit(
+    strat,
+    means: Sequence[float],
+    num_rounds: int,
+    sigma: Optional[float] = None,
+) -> Tuple[float, np.ndarray]:
+    # bernoulli rewards, or gaussian ones if sigma is given. Returns the
+    # pseudo regret sum_a gap_a * N_a and the pull counts N_a
+    means = np.asarray(means)
+    counts = np.zeros(len(means), dtype=np.int64)
+    for _ in range(num_rounds):
+        arm = strat.choose_arm()
+        if sigma is None:
+            result = float(np.random.binomial(1, means[arm]))
+        else:
+            result = np.random.normal(means[arm], sigma)
+        strat.record_result(arm, result)
+        counts[arm] += 1
+    return np.sum((np.max(means) - means) * counts), counts
+
+
+def ucb_regret_bound(means: Sequence[float], num_rounds: int) -> float:
+    # Auer, Cesa-Bianchi and Fischer 2002, theorem 1
+    means = np.asarray(means)
+    gaps = np.max(means) - means
+    gaps = gaps[gaps > 0]
+    return np.sum(8 * np.log(num_rounds) / gaps + (1 + np.pi**2 / 3) * gaps)
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from tests.helpers import load
+
+general = load("general", "bandit")
+stochastic = load("stochastic", "bandit")
+contextual = load("contextual", "bandit")
+
+
+def test_general_bernoulli_bandit_sets_coin_flips() -> None:
+    # coin_flips used to never be set, so pull_arm raised AttributeError
+    bandit = general.BernoulliBandit([0.1, 0.9])
+    pulls = np.empty((2000, 2))
+    for i in range(len(pulls)):
+        bandit.process_context(None)
+        bandit.process_arm(0)
+        pulls[i] = [bandit.pull_arm(0), bandit.pull_arm(1)]
+    assert set(np.unique(pulls)) <= {0.0, 1.0}
+    np.testing.assert_allclose(np.mean(pulls, axis=0), [0.1, 0.9], atol=0.03)
+
+
+@pytest.mark.parametrize("module", [general, stochastic])
+def test_finite_armed_stochastic_bandit(module) -> None:
+    if module is general:
+        arms = [module.BernoulliBanditArm(0.7), module.GaussianBanditArm(-1.0, 0.5)]
+        fix = lambda bandit: bandit.process_context(None)
+    else:
+        arms = [module.GaussianStochasticBanditArm(2.0, 1.0), module.GaussianStochasticBanditArm(-1.0, 0.5)]
+        fix = lambda bandit: bandit.fix_probabilistic_state()
+    bandit = module.FiniteArmedStochasticBandit(arms)
+
+    pulls = np.empty((4000, 2))
+    for i in range(len(pulls)):
+        fix(bandit)
+        pulls[i] = [bandit.pull_arm(0), bandit.pull_arm(1)]
+    expected = [0.7 if module is general else 2.0, -1.0]
+    np.testing.assert_allclose(np.mean(pulls, axis=0), expected, atol=0.08)
+    assert np.std(pulls[:, 1]) == pytest.approx(0.5, abs=0.03)
+
+
+def test_stochastic_bernoulli_bandit() -> None:
+    bandit = stochastic.BernoulliBandit([0.2, 0.6])
+    pulls = np.empty((2000, 2))
+    for i in range(len(pulls)):
+        bandit.fix_probabilistic_state()
+        pulls[i] = [bandit.pull_arm(0), bandit.pull_arm(1)]
+    np.testing.assert_allclose(np.mean(pulls, axis=0), [0.2, 0.6], atol=0.03)
+
+
+def test_gaussian_linear_bandit() -> None:
+    theta = np.array([[0.1, 0.2, 0.4], [1.0, 0.0, -1.0]])
+    context = np.array([1.0, 2.0, 3.0])
+    bandit = contextual.GaussianLinearBandit(theta)
+    pulls = np.empty((4000, 2))
+    for i in range(len(pulls)):
+        bandit.fix_probabilistic_state(context)
+        pulls[i] = [bandit.pull_arm(0), bandit.pull_arm(1)]
+    np.testing.assert_allclose(np.mean(pulls, axis=0), theta @ context, atol=0.08)
+
+
+def test_finite_armed_contextual_bandit() -> None:
+    thetas = [np.array([0.1, 0.2, 0.4]), np.array([0.1, 0.05, 0.0])]
+    context = np.array([0.5, 0.5, 0.5])
+    bandit = contextual.FiniteArmedContextualBandit([contextual.GaussianLinearBanditArm(t) for t in thetas])
+    pulls = np.empty((4000, 2))
+    for i in range(len(pulls)):
+        bandit.fix_probabilistic_state(context)
+        pulls[i] = [bandit.pull_arm(0), bandit.pull_arm(1)]
+    np.testing.assert_allclose(np.mean(pulls, axis=0), [t @ context for t in thetas], atol=0.08)
+
+
+def test_sinusoidal_bandit() -> None:
+    # used to call len() on the scalar mean
+    context = np.array([1.0, 0.5])
+    bandit = contextual.SinusoidalBandit(2, 3.0, 4)
+    pulls = np.empty((4000, 4))
+    for i in range(len(pulls)):
+        bandit.fix_probabilistic_state(context)
+        assert len(bandit.rewards) == 4
+        pulls[i] = [bandit.pull_arm(n) for n in range(4)]
+    np.testing.assert_allclose(np.mean(pulls, axis=0), 3.0 * np.prod(np.sin(context)), atol=0.08)
+
+
+def test_sinusoidal_bandit_requires_num_arms() -> None:
+    with pytest.raises(TypeError):
+        contextual.SinusoidalBandit(2, 3.0)
+
+
+@pytest.mark.parametrize("arm", [
+    general.BernoulliBanditArm(0.5),
+    general.GaussianBanditArm(0.0, 1.0),
+    stochastic.GaussianStochasticBanditArm(0.0, 1.0),
+    contextual.GaussianLinearBanditArm(np.zeros(2)),
+], ids=["general-bernoulli", "general-gaussian", "stochastic-gaussian", "contextual-linear"])
+def test_arms_have_slots(arm) -> None:
+    assert not hasattr(arm, "__dict__")
+    with pytest.raises(AttributeError):
+        arm.unknown = 1.0
@@ -0,0 +1,78 @@
+import time
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from tests.helpers import load
+
+strategy = load("general", "strategy")
+distributions = load("general", "distributions")
+contextual = load("contextual", "strategy")
+
+NUM_ARMS = 10
+NUM_DECISIONS = 5000
+
+# decisions per second (one choose_arm plus one record_result) recorded
+# with NUM_ARMS arms on the development machine. A run fails when it drops
+# below TOLERANCE times the baseline, which leaves room for slower hosts
+# but still catches a change that makes a strategy several times slower.
+# Update the baseline in the same commit as a deliberate speed change.
+BASELINES = {
+    "UniformExploration": 2700000,
+    "EpsilonGreedy": 100000,
+    "UCB": 115000,
+    "ThompsonSamplingBeta": 50000,
+    "ThompsonSamplingConjugateDistributions": 57000,
+    "ThompsonSamplingBootstrap": 5000,
+    "SuccessiveElimination": 370000,
+    "LUCB": 140000,
+    "TrackAndStop": 3000,
+    "DiscreteEpsilonGreedyStrategy": 50000,
+}
+TOLERANCE = 0.2
+
+STRATEGIES = {
+    "UniformExploration": lambda: strategy.UniformExploration(NUM_ARMS, 10),
+    "EpsilonGreedy": lambda: strategy.EpsilonGreedy(NUM_ARMS, 0.1),
+    "UCB": lambda: strategy.UCB(NUM_ARMS),
+    "ThompsonSamplingBeta": lambda: strategy.ThompsonSamplingBeta(NUM_ARMS),
+    "ThompsonSamplingConjugateDistributions": lambda: strategy.ThompsonSamplingConjugateDistributions(
+        NUM_ARMS, [distributions.BetaBernoulli([1.0, 1.0]) for _ in range(NUM_ARMS)]
+    ),
+    "ThompsonSamplingBootstrap": lambda: strategy.ThompsonSamplingBootstrap(NUM_ARMS),
+    "SuccessiveElimination": lambda: strategy.SuccessiveElimination(NUM_ARMS, 0.05),
+    "LUCB": lambda: strategy.LUCB(NUM_ARMS, 0.05),
+    "TrackAndStop": lambda: strategy.TrackAndStop(NUM_ARMS, 0.05),
+}
+
+
+def decisions_per_second(make_strategy: Callable[[], object], contexts=None) -> float:
+    # best of three, so a single hiccup of the host doesn't fail the run
+    rewards = np.random.binomial(1, 0.5, NUM_DECISIONS).astype(float)
+    best = 0.0
+    for _ in range(3):
+        strat = make_strategy()
+        start = time.perf_counter()
+        if contexts is None:
+            for result in rewards:
+                strat.record_result(strat.choose_arm(), result)
+        else:
+            for context, result in zip(contexts, rewards):
+                strat.record_result(strat.choose_arm(context), result)
+        best = max(best, NUM_DECISIONS / (time.perf_counter() - start))
+    return best
+
+
+@pytest.mark.parametrize("name", list(STRATEGIES))
+def test_decisions_per_second(name: str) -> None:
+    rate = decisions_per_second(STRATEGIES[name])
+    assert rate > TOLERANCE * BASELINES[name], f"{name}: {rate:.0f} decisions per second"
+
+
+def test_discrete_epsilon_greedy_decisions_per_second() -> None:
+    contexts = np.random.uniform(size=(NUM_DECISIONS, 3))
+    make_strategy = lambda: contextual.DiscreteEpsilonGreedyStrategy(0, 1, 4, 3, NUM_ARMS, 0.1)
+    rate = decisions_per_second(make_strategy, contexts)
+    name = "DiscreteEpsilonGreedyStrategy"
+    assert rate > TOLERANCE * BASELINES[name], f"{name}: {rate:.0f} decisions per second"
@@ -0,0 +1,109 @@
+import numpy as np
+import pytest
+
+from tests.helpers import load, run_bandit
+
+strategy = load("general", "strategy")
+bandit = load("general", "bandit")
+simulate = load("general", "simulate")
+
+MEANS = [0.3, 0.5, 0.8]
+MAX_ROUNDS = 100000
+STRATEGIES = ["SuccessiveElimination", "LUCB", "TrackAndStop"]
+
+
+def run_until_done(strat, means, max_rounds: int = MAX_ROUNDS) -> int:
+    for t in range(max_rounds):
+        if strat.is_done():
+            return t
+        arm = strat.choose_arm()
+        strat.record_result(arm, float(np.random.binomial(1, means[arm])))
+    return max_rounds
+
+
+@pytest.mark.parametrize("name", STRATEGIES)
+def test_identifies_best_arm(name: str) -> None:
+    for _ in range(10):
+        strat = getattr(strategy, name)(3, 0.05)
+        num_rounds = run_until_done(strat, MEANS)
+        assert num_rounds < MAX_ROUNDS
+        assert strat.best_arm == 2
+
+
+@pytest.mark.parametrize("name", STRATEGIES)
+def test_sample_complexity_grows_as_gap_shrinks(name: str) -> None:
+    easy = run_until_done(getattr(strategy, name)(2, 0.05), [0.2, 0.8])
+    hard = run_until_done(getattr(strategy, name)(2, 0.05), [0.4, 0.6])
+    assert easy < hard < MAX_ROUNDS
+
+
+@pytest.mark.parametrize("name", STRATEGIES)
+def test_keeps_recommending_once_done(name: str) -> None:
+    strat = getattr(strategy, name)(3, 0.05)
+    run_until_done(strat, MEANS)
+    for _ in range(20):
+        assert strat.choose_arm() == 2
+        strat.record_result(0, 1.0)
+    assert strat.best_arm == 2
+
+
+@pytest.mark.parametrize("name", STRATEGIES)
+def test_argument_checks(name: str) -> None:
+    with pytest.raises(AssertionError):
+        getattr(strategy, name)(1, 0.05)
+    with pytest.raises(AssertionError):
+        getattr(strategy, name)(3, 1.5)
+
+
+@pytest.mark.parametrize("name", ["SuccessiveElimination", "LUCB"])
+def test_rejects_results_out_of_schedule(name: str) -> None:
+    strat = getattr(strategy, name)(3, 0.05)
+    assert strat.choose_arm() == 0
+    with pytest.raises(AssertionError, match="expected a result for arm 0"):
+        strat.record_result(2, 1.0)
+    np.testing.assert_array_equal(strat.num_pulls, [0, 0, 0])
+
+
+def test_successive_elimination_active_set() -> None:
+    strat = strategy.SuccessiveElimination(4, 0.05)
+    means = [0.1, 0.4, 0.45, 0.9]
+    sizes = [len(strat.active)]
+    while not strat.is_done():
+        run_bandit(strat, means, len(strat.active))
+        assert 3 in strat.active
+        sizes.append(len(strat.active))
+    assert sizes == sorted(sizes, reverse=True)
+    np.testing.assert_array_equal(strat.active, [3])
+
+
+def test_track_and_stop_optimal_weights() -> None:
+    strat = strategy.TrackAndStop(3, 0.05)
+    w = strat.optimal_weights(np.array([0.3, 0.5, 0.8]))
+    assert np.sum(w) == pytest.approx(1.0)
+    # the arm closest to the best needs the most samples after the best
+    assert w[2] > w[1] > w[0]
+    # for two gaussian arms the optimal allocation is even
+    np.testing.assert_allclose(strategy.TrackAndStop(2, 0.05).optimal_weights(np.array([0.2, 0.7])), [0.5, 0.5])
+    # ties fall back to uniform
+    np.testing.assert_allclose(strat.optimal_weights(np.array([0.5, 0.5, 0.1])), [1/3, 1/3, 1/3])
+
+
+def test_simulate_best_arm_identification() -> None:
+    arms = [bandit.BernoulliBanditArm(p) for p in MEANS]
+    strats = [getattr(strategy, name)(3, 0.05) for name in STRATEGIES]
+    best_arms, num_rounds = simulate.simulate_best_arm_identification(
+        strats, bandit.FiniteArmedStochasticBandit(arms), None, MAX_ROUNDS
+    )
+    np.testing.assert_array_equal(best_arms, [2, 2, 2])
+    assert np.all(num_rounds < MAX_ROUNDS)
+    np.testing.assert_array_equal(num_rounds, [strat.num_rounds_so_far for strat in strats])
+
+
+def test_simulate_best_arm_identification_runs_out_of_rounds() -> None:
+    arms = [bandit.BernoulliBanditArm(0.5) for _ in range(3)]
+    strats = [getattr(strategy, name)(3, 0.05) for name in STRATEGIES]
+    best_arms, num_rounds = simulate.simulate_best_arm_identification(
+        strats, bandit.FiniteArmedStochasticBandit(arms), None, 300
+    )
+    np.testing.assert_array_equal(best_arms, [-1, -1, -1])
+    np.testing.assert_array_equal(num_rounds, [300, 300, 300])
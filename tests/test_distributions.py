@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from tests.helpers import load
+
+
+@pytest.fixture(params=["general", "stochastic"])
+def distributions(request):
+    return load(request.param, "distributions")
+
+
+def test_beta_bernoulli_posterior(distributions) -> None:
+    x = np.random.binomial(1, 0.3, 200).astype(float)
+    dist = distributions.BetaBernoulli([2.0, 3.0])
+    for xi in x:
+        dist.update_prior(xi)
+    assert dist.prior_params == [2.0 + np.sum(x), 3.0 + len(x) - np.sum(x)]
+
+    alpha, beta = dist.prior_params
+    samples = [dist.likelihood_mean_sample_prior() for _ in range(4000)]
+    assert np.mean(samples) == pytest.approx(alpha / (alpha + beta), abs=0.005)
+
+
+def test_normal_gamma_normal_update_prior_runs(distributions) -> None:
+    # used to raise NameError on the undefined n_0_tau
+    dist = distributions.NormalGammaNormal([0.0, 1.0, 1.0, 1.0])
+    dist.update_prior(1.0)
+    assert dist.prior_params == (0.5, 2.0, 1.5, 1.25)
+
+
+def test_normal_gamma_normal_posterior(distributions) -> None:
+    mu_0, n_0, alpha, beta = 0.5, 2.0, 3.0, 1.5
+    x = np.random.normal(2.0, 0.5, 500)
+    dist = distributions.NormalGammaNormal([mu_0, n_0, alpha, beta])
+    for xi in x:
+        dist.update_prior(xi)
+
+    # closed form posterior, eg Murphy 2007 "Conjugate Bayesian analysis
+    # of the Gaussian distribution", section 3
+    n, x_bar = len(x), np.mean(x)
+    expected = (
+        (n_0 * mu_0 + n * x_bar) / (n_0 + n),
+        n_0 + n,
+        alpha + n / 2,
+        beta + np.sum((x - x_bar)**2) / 2 + n_0 * n * (x_bar - mu_0)**2 / (2 * (n_0 + n)),
+    )
+    np.testing.assert_allclose(dist.prior_params, expected)
+
+
+def test_normal_gamma_normal_sample_spread(distributions) -> None:
+    # the marginal of mu is a student t with variance beta / (n_0 (alpha - 1))
+    mu_0, n_0, alpha, beta = 1.0, 4.0, 6.0, 10.0
+    dist = distributions.NormalGammaNormal([mu_0, n_0, alpha, beta])
+    samples = [dist.likelihood_mean_sample_prior() for _ in range(20000)]
+    assert np.mean(samples) == pytest.approx(mu_0, abs=0.02)
+    assert np.var(samples) == pytest.approx(beta / (n_0 * (alpha - 1)), rel=0.1)
@@ -0,0 +1,210 @@
+import functools
+
+import numpy as np
+import pytest
+
+from tests.helpers import flat_modules, load
+
+evaluate = load("general", "evaluate")
+strategy = load("general", "strategy")
+
+MEANS = np.array([0.2, 0.5, 0.8])
+
+
+class FixedArm(strategy.Strategy):
+    __slots__ = ("arm",)
+
+    def __init__(self, arm: int) -> None:
+        self.arm = arm
+
+    def choose_arm(self) -> int:
+        return self.arm
+
+    def record_result(self, arm: int, result: float) -> None:
+        pass
+
+
+class RandomArm(strategy.Strategy):
+    __slots__ = ("num_arms",)
+
+    def __init__(self, num_arms: int) -> None:
+        self.num_arms = num_arms
+
+    def choose_arm(self) -> int:
+        return np.random.randint(self.num_arms)
+
+    def record_result(self, arm: int, result: float) -> None:
+        pass
+
+
+class SignOfContext:
+    # arm 1 when the first context coordinate is positive, arm 0 otherwise
+    def choose_arm(self, context: np.ndarray) -> int:
+        return int(context[0] > 0)
+
+    def record_result(self, arm: int, result: float) -> None:
+        pass
+
+
+@pytest.fixture
+def uniform_logs(tmp_path):
+    # uniformly random logging policy over the arms of MEANS
+    num_rows = 20000
+    arms = np.random.randint(len(MEANS), size=num_rows)
+    rewards = np.random.binomial(1, MEANS[arms]).astype(float)
+    evaluate.save_logs(str(tmp_path), arms, np.full(num_rows, 1 / len(MEANS)), rewards)
+    return str(tmp_path)
+
+
+def test_logs_round_trip(tmp_path) -> None:
+    evaluate.save_logs(str(tmp_path), [0, 2, 1], [0.5, 0.25, 0.25], [1.0, 0.0, 0.5], np.eye(3))
+    logs = evaluate.load_logs(str(tmp_path))
+    assert set(logs) == {"arm", "propensity", "reward", "context"}
+    assert all(isinstance(column, np.memmap) for column in logs.values())
+    np.testing.assert_array_equal(logs["arm"], [0, 2, 1])
+    np.testing.assert_array_equal(logs["context"], np.eye(3))
+
+
+@pytest.mark.parametrize("propensity", [0.0, -0.5, 1.5, np.nan])
+def test_save_logs_rejects_bad_propensities(tmp_path, propensity: float) -> None:
+    with pytest.raises(AssertionError, match="propensities"):
+        evaluate.save_logs(str(tmp_path), [0, 1], [0.5, propensity], [1.0, 0.0])
+
+
+def test_evaluate_rejects_bad_propensities(tmp_path) -> None:
+    # logs written by something other than save_logs
+    np.save(str(tmp_path / "arm.npy"), np.array([0, 1, 0]))
+    np.save(str(tmp_path / "propensity.npy"), np.array([0.5, 0.0, 0.5]))
+    np.save(str(tmp_path / "reward.npy"), np.array([1.0, 0.0, 1.0]))
+    with pytest.raises(AssertionError, match="propensities"):
+        evaluate.evaluate(FixedArm(0), evaluate.load_logs(str(tmp_path)), 2)
+
+
+def test_iter_chunks(uniform_logs) -> None:
+    logs = evaluate.load_logs(uniform_logs)
+    chunks = list(evaluate.iter_chunks(logs, 3000))
+    assert [len(chunk["arm"]) for chunk in chunks] == [3000] * 6 + [2000]
+    np.testing.assert_array_equal(np.concatenate([chunk["reward"] for chunk in chunks]), logs["reward"])
+
+    chunks = list(evaluate.iter_chunks(logs, 3000, 100, 7000))
+    np.testing.assert_array_equal(np.concatenate([chunk["arm"] for chunk in chunks]), logs["arm"][100:7000])
+
+
+def test_iter_chunks_columns(tmp_path) -> None:
+    evaluate.save_logs(str(tmp_path), [0, 1, 0], [0.5, 0.5, 0.5], [1.0, 0.0, 1.0], np.eye(3))
+    logs = evaluate.load_logs(str(tmp_path))
+    for chunk in evaluate.iter_chunks(logs, 2, columns=["arm", "reward"]):
+        assert set(chunk) == {"arm", "reward"}
+
+
+def test_non_contextual_evaluation_skips_contexts(tmp_path) -> None:
+    evaluate.save_logs(str(tmp_path), [0, 1, 0], [0.5, 0.5, 0.5], [1.0, 0.0, 1.0], np.eye(3))
+    logs = evaluate.load_logs(str(tmp_path))
+    # a context column that fails on any read
+    logs["context"] = None
+    estimates = evaluate.evaluate(FixedArm(0), logs, 2)
+    assert estimates["replay"].mean == 1.0
+
+
+def test_online_moments() -> None:
+    x = np.random.normal(3.0, 2.0, 1000)
+    moments = evaluate.OnlineMoments()
+    for batch in np.array_split(x, 7):
+        moments.add_batch(batch)
+    moments.add_batch(np.array([]))
+    assert moments.n == 1000
+    assert moments.mean == pytest.approx(np.mean(x))
+    assert moments.variance() == pytest.approx(np.var(x, ddof=1))
+    assert moments.standard_error() == pytest.approx(np.std(x, ddof=1) / np.sqrt(1000))
+
+
+def test_online_moments_merge() -> None:
+    x = np.random.exponential(size=500)
+    left, right = evaluate.OnlineMoments(), evaluate.OnlineMoments()
+    left.add_batch(x[:120])
+    right.add_batch(x[120:])
+    left.merge(right.n, right.mean, right.m2)
+    assert left.n == 500
+    assert left.mean == pytest.approx(np.mean(x))
+    assert left.variance() == pytest.approx(np.var(x, ddof=1))
+
+
+def test_online_moments_empty() -> None:
+    moments = evaluate.OnlineMoments()
+    assert moments.variance() == 0.0
+    assert moments.standard_error() == 0.0
+
+
+def test_estimators_are_unbiased_for_a_fixed_policy(uniform_logs) -> None:
+    logs = evaluate.load_logs(uniform_logs)
+    estimates = evaluate.evaluate(FixedArm(2), logs, len(MEANS), chunk_size=3000)
+    assert estimates["replay"].n == np.sum(logs["arm"] == 2)
+    assert estimates["ips"].n == estimates["dr"].n == len(logs["arm"])
+    for moments in estimates.values():
+        assert abs(moments.mean - MEANS[2]) < 4 * moments.standard_error()
+    # the reward model removes most of the importance weighting noise
+    assert estimates["dr"].standard_error() < estimates["ips"].standard_error()
+
+
+def test_learning_policy_improves_on_random(uniform_logs) -> None:
+    logs = evaluate.load_logs(uniform_logs)
+    estimates = evaluate.evaluate(strategy.UCB(len(MEANS)), logs, len(MEANS))
+    assert estimates["replay"].mean > np.mean(MEANS) + 0.2
+
+
+def test_contextual_evaluation(tmp_path) -> None:
+    num_rows = 10000
+    contexts = np.random.normal(size=(num_rows, 2))
+    arms = np.random.randint(2, size=num_rows)
+    # arm 1 pays when x_0 > 0 and arm 0 otherwise
+    rewards = (arms == (contexts[:, 0] > 0)).astype(float)
+    evaluate.save_logs(str(tmp_path), arms, np.full(num_rows, 0.5), rewards, contexts)
+
+    estimates = evaluate.evaluate(SignOfContext(), evaluate.load_logs(str(tmp_path)), 2, contextual=True)
+    assert estimates["replay"].mean == 1.0
+    assert estimates["ips"].mean == pytest.approx(1.0, abs=0.05)
+
+
+def test_contextual_evaluation_needs_contexts(uniform_logs) -> None:
+    with pytest.raises(AssertionError, match="context"):
+        evaluate.evaluate(SignOfContext(), evaluate.load_logs(uniform_logs), len(MEANS), contextual=True)
+
+
+def test_evaluate_parallel_matches_serial(uniform_logs) -> None:
+    serial = evaluate.evaluate(FixedArm(1), evaluate.load_logs(uniform_logs), len(MEANS))
+    # worker processes unpickle evaluate and strategy by their bare names
+    with flat_modules("general"):
+        parallel = evaluate.evaluate_parallel(functools.partial(FixedArm, 1), uniform_logs, len(MEANS), 3, 4096)
+
+    # replay and ips don't depend on the reward model, which every shard
+    # rebuilds from scratch, so they merge back to the serial values
+    for name in ["replay", "ips"]:
+        assert parallel[name].n == serial[name].n
+        assert parallel[name].mean == pytest.approx(serial[name].mean)
+        assert parallel[name].variance() == pytest.approx(serial[name].variance())
+    assert parallel["dr"].n == serial["dr"].n
+
+
+def test_evaluate_parallel_shards_draw_independent_streams(tmp_path) -> None:
+    # every shard sees the same log, so identical random streams would give
+    # identical matches and identical shard means
+    num_rows = 3000
+    arms = np.tile(np.arange(3), num_rows // 3)
+    evaluate.save_logs(str(tmp_path), np.tile(arms, 3), np.full(3 * num_rows, 1 / 3), np.tile(arms / 2, 3))
+
+    shards = []
+    for i, seed in enumerate(np.random.SeedSequence(7).spawn(3)):
+        # what a forked worker starts from
+        np.random.seed(0)
+        args = (functools.partial(RandomArm, 3), str(tmp_path), 3, 1024, False, i * num_rows, (i + 1) * num_rows, seed)
+        shards.append(evaluate._evaluate_shard(args))
+
+    with flat_modules("general"):
+        parallel = evaluate.evaluate_parallel(functools.partial(RandomArm, 3), str(tmp_path), 3, 3, 1024, seed=7)
+        again = evaluate.evaluate_parallel(functools.partial(RandomArm, 3), str(tmp_path), 3, 3, 1024, seed=7)
+
+    assert len({shard["replay"] for shard in shards}) == 3
+    # the same seed reproduces the same run
+    for name in evaluate.ESTIMATORS:
+        assert parallel[name].n == again[name].n
+        assert parallel[name].mean == again[name].mean
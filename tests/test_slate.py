@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from tests.helpers import load, run_bandit
+
+strategy = load("general", "strategy")
+distributions = load("general", "distributions")
+bandit = load("general", "bandit")
+simulate = load("general", "simulate")
+
+MEANS = [0.1, 0.3, 0.5, 0.7, 0.9]
+
+
+def slate_strategies():
+    num_arms = len(MEANS)
+    return [
+        strategy.UCB(num_arms),
+        strategy.ThompsonSamplingBeta(num_arms),
+        strategy.EpsilonGreedy(num_arms, 0.1),
+        strategy.ThompsonSamplingConjugateDistributions(
+            num_arms, [distributions.BetaBernoulli([1.0, 1.0]) for _ in range(num_arms)]
+        ),
+    ]
+
+
+def test_top_k_matches_full_sort() -> None:
+    for _ in range(50):
+        values = np.random.normal(size=100)
+        for k in [1, 7, 100]:
+            np.testing.assert_array_equal(strategy.top_k(values, k), np.argsort(-values)[:k])
+
+
+def test_top_k_bounds() -> None:
+    np.testing.assert_array_equal(strategy.top_k([3.0, 1.0, 5.0, 2.0], 2), [2, 0])
+    with pytest.raises(AssertionError):
+        strategy.top_k([1.0, 2.0], 0)
+    with pytest.raises(AssertionError):
+        strategy.top_k([1.0, 2.0], 3)
+
+
+@pytest.mark.parametrize("index", range(4), ids=["ucb", "beta", "epsilon-greedy", "conjugate"])
+def test_choose_arms_topk_after_learning(index: int) -> None:
+    strat = slate_strategies()[index]
+    run_bandit(strat, MEANS, 3000)
+    if isinstance(strat, strategy.EpsilonGreedy):
+        strat.epsilon = 0.0
+
+    slates = np.array([strat.choose_arms_topk(3) for _ in range(20)])
+    for slate in slates:
+        assert len(set(slate)) == 3
+    # the best arm leads most slates
+    assert np.mean(slates[:, 0] == 4) > 0.8
+
+
+def test_ucb_slate_tries_unpulled_arms_first() -> None:
+    strat = strategy.UCB(5)
+    first = strat.choose_arms_topk(3)
+    for arm in first:
+        strat.record_result(arm, 1.0)
+    second = strat.choose_arms_topk(2)
+    assert set(first) | set(second) == set(range(5))
+
+
+def test_epsilon_greedy_slate_is_top_means() -> None:
+    strat = strategy.EpsilonGreedy(5, 0.0)
+    for arm, result in enumerate([0.2, 0.9, 0.1, 0.5, 0.4]):
+        strat.record_result(arm, result)
+    np.testing.assert_array_equal(strat.choose_arms_topk(3), [1, 3, 4])
+
+
+def test_choose_arms_topk_not_supported() -> None:
+    with pytest.raises(NotImplementedError):
+        strategy.UniformExploration(3, 2).choose_arms_topk(2)
+
+
+def test_simulate_slate() -> None:
+    arms = [bandit.BernoulliBanditArm(p) for p in MEANS]
+    results = simulate.simulate_slate(slate_strategies(), bandit.FiniteArmedStochasticBandit(arms), None, 500, 2)
+    assert results.shape == (4, 500, 2)
+    assert set(np.unique(results)) <= {0.0, 1.0}
+    # after learning, the first position mostly holds the best arm (0.9)
+    # and the second one the runner up (0.7), far above random arms (0.5)
+    position_means = np.mean(results[:, 250:], axis=1)
+    assert np.all(position_means[:, 0] > 0.75)
+    assert np.all(position_means[:, 1] > 0.55)
+
+
+def test_simulate_slate_rejects_unsupported_strategies() -> None:
+    arms = [bandit.BernoulliBanditArm(p) for p in MEANS]
+    strats = [strategy.UCB(5), strategy.ThompsonSamplingBootstrap(5)]
+    with pytest.raises(NotImplementedError):
+        simulate.simulate_slate(strats, bandit.FiniteArmedStochasticBandit(arms), None, 10, 2)
@@ -0,0 +1,165 @@
+import numpy as np
+import pytest
+
+from tests.helpers import load, run_bandit, ucb_regret_bound
+
+MEANS = [0.3, 0.5, 0.8]
+NUM_ROUNDS = 2000
+# regret of pulling arms uniformly at random
+RANDOM_REGRET = NUM_ROUNDS * np.mean(np.max(MEANS) - np.array(MEANS))
+
+
+@pytest.fixture(params=["general", "stochastic"])
+def strategy(request):
+    return load(request.param, "strategy")
+
+
+@pytest.fixture(params=["general", "stochastic"])
+def modules(request):
+    return load(request.param, "strategy"), load(request.param, "distributions")
+
+
+def test_uniform_exploration(strategy) -> None:
+    regret, counts = run_bandit(strategy.UniformExploration(3, 20), MEANS, NUM_ROUNDS)
+    np.testing.assert_array_equal(counts, [20, 20, NUM_ROUNDS - 40])
+    assert regret == pytest.approx(16.0)
+
+
+def test_epsilon_greedy_regret(strategy) -> None:
+    # exploration alone costs epsilon * RANDOM_REGRET
+    regret, counts = run_bandit(strategy.EpsilonGreedy(3, 0.1), MEANS, NUM_ROUNDS)
+    assert regret < 3 * 0.1 * RANDOM_REGRET
+    assert np.argmax(counts) == 2
+
+
+def test_epsilon_greedy_counts_pulls(strategy) -> None:
+    # record_result used to never increment num_pulls
+    strat = strategy.EpsilonGreedy(3, 0.1)
+    for arm, result in [(0, 1.0), (0, 0.0), (2, 0.5)]:
+        strat.record_result(arm, result)
+    np.testing.assert_array_equal(strat.num_pulls, [2, 0, 1])
+    np.testing.assert_allclose(strat.means(), [0.5, 0.0, 0.5])
+
+
+def test_epsilon_greedy_explores_with_probability_epsilon(strategy) -> None:
+    strat = strategy.EpsilonGreedy(3, 0.0)
+    strat.record_result(1, 1.0)
+    assert all(strat.choose_arm() == 1 for _ in range(200))
+
+    strat.epsilon = 0.3
+    choices = np.array([strat.choose_arm() for _ in range(6000)])
+    # greedy 70% of the time, uniform over the 3 arms otherwise
+    assert np.mean(choices == 1) == pytest.approx(0.7 + 0.3 / 3, abs=0.02)
+
+
+def test_ucb_regret_bound(strategy) -> None:
+    regret, _ = run_bandit(strategy.UCB(3), MEANS, NUM_ROUNDS)
+    assert regret < ucb_regret_bound(MEANS, NUM_ROUNDS)
+
+
+def test_ucb_accumulates_fractional_rewards(strategy) -> None:
+    # integer sums used to truncate gaussian rewards
+    strat = strategy.UCB(2)
+    strat.record_result(0, 0.25)
+    strat.record_result(0, 0.5)
+    assert strat.sum_results[0] == pytest.approx(0.75)
+
+
+@pytest.mark.parametrize("name", ["UCB", "EpsilonGreedy"])
+def test_compact_dtypes(strategy, name: str) -> None:
+    args = (4, 0.1) if name == "EpsilonGreedy" else (4,)
+    strat = getattr(strategy, name)(*args, count_dtype=np.int32, sum_dtype=np.float32)
+    assert strat.num_pulls.dtype == np.int32
+    assert strat.sum_results.dtype == np.float32
+    run_bandit(strat, [0.2, 0.4, 0.6, 0.8], 200)
+    assert strat.num_pulls.dtype == np.int32
+    assert strat.sum_results.dtype == np.float32
+
+
+def test_thompson_sampling_beta(strategy) -> None:
+    strat = strategy.ThompsonSamplingBeta(3)
+    regret, counts = run_bandit(strat, MEANS, NUM_ROUNDS)
+    assert regret < 0.1 * RANDOM_REGRET
+    # one pseudo count per pull on top of the uniform prior
+    np.testing.assert_allclose(np.add(*strat.beta_params) - 2.0, counts)
+
+
+def test_thompson_sampling_conjugate_matches_beta(modules) -> None:
+    # with BetaBernoulli priors it is the same algorithm, and it draws the
+    # same random numbers in the same order
+    strategy, distributions = modules
+    conj_dists = [distributions.BetaBernoulli([1.0, 1.0]) for _ in MEANS]
+    state = np.random.get_state()
+    _, beta_counts = run_bandit(strategy.ThompsonSamplingBeta(3), MEANS, NUM_ROUNDS)
+    np.random.set_state(state)
+    _, conj_counts = run_bandit(strategy.ThompsonSamplingConjugateDistributions(3, conj_dists), MEANS, NUM_ROUNDS)
+    np.testing.assert_array_equal(beta_counts, conj_counts)
+
+
+def test_thompson_sampling_normal_gamma(modules) -> None:
+    strategy, distributions = modules
+    conj_dists = [distributions.NormalGammaNormal([0.0, 1.0, 1.0, 1.0]) for _ in MEANS]
+    strat = strategy.ThompsonSamplingConjugateDistributions(3, conj_dists)
+    regret, _ = run_bandit(strat, MEANS, NUM_ROUNDS, sigma=0.5)
+    assert regret < 0.1 * RANDOM_REGRET
+
+
+def test_thompson_sampling_bootstrap(strategy) -> None:
+    # with few samples per arm the bootstrap can lock onto a bad arm for a
+    # long time, so this only checks it does clearly better than random
+    regret, counts = run_bandit(strategy.ThompsonSamplingBootstrap(3), MEANS, NUM_ROUNDS, sigma=0.5)
+    assert regret < 0.9 * RANDOM_REGRET
+    assert np.argmax(counts) == 2
+
+
+def test_strategies_have_slots(modules) -> None:
+    strategy, distributions = modules
+    strats = [
+        strategy.UniformExploration(2, 1),
+        strategy.EpsilonGreedy(2, 0.1),
+        strategy.UCB(2),
+        strategy.ThompsonSamplingBeta(2),
+        strategy.ThompsonSamplingConjugateDistributions(2, [distributions.BetaBernoulli([1.0, 1.0])] * 2),
+        strategy.ThompsonSamplingBootstrap(2),
+    ]
+    for strat in strats:
+        assert not hasattr(strat, "__dict__")
+
+
+def test_discrete_epsilon_greedy_learns_each_cell() -> None:
+    strategy = load("contextual", "strategy")
+    # context in [0, 1]^2 on a 3x3 grid, arm 1 is better when x_0 > 0.5.
+    # x_0 stays away from the middle column, where neither arm is better
+    strat = strategy.DiscreteEpsilonGreedyStrategy(0, 1, 3, 2, 2, 0.1)
+    regret = 0.0
+    for _ in range(4000):
+        context = np.array([np.random.choice([0.1, 0.9]), np.random.uniform()])
+        means = [0.6, 0.2] if context[0] < 0.5 else [0.2, 0.6]
+        arm = strat.choose_arm(context)
+        strat.record_result(arm, float(np.random.binomial(1, means[arm])))
+        regret += 0.6 - means[arm]
+
+    assert regret < 0.25 * 4000 * 0.4
+    assert np.sum(strat.num_pulls) == 4000
+    means = strat.sum_results / np.maximum(strat.num_pulls, 1)
+    # rows are grid points, x_0 = 0 is rows 0-2 and x_0 = 1 is rows 6-8
+    np.testing.assert_array_equal(np.argmax(means[:3], axis=1), [0, 0, 0])
+    np.testing.assert_array_equal(np.argmax(means[6:], axis=1), [1, 1, 1])
+
+
+def test_discrete_epsilon_greedy_compact_dtypes() -> None:
+    strategy = load("contextual", "strategy")
+    strat = strategy.DiscreteEpsilonGreedyStrategy(0, 1, 4, 3, 5, 0.1, count_dtype=np.int32, sum_dtype=np.float32)
+    assert strat.num_pulls.shape == (4**3, 5)
+    assert strat.num_pulls.dtype == np.int32
+    assert strat.sum_results.dtype == np.float32
+    assert not hasattr(strat, "__dict__")
+
+
+def test_simulate_scripts() -> None:
+    general = load("general", "simulate")
+    stochastic = load("stochastic", "simulate")
+    contextual = load("contextual", "simulate")
+    assert general.results.shape == (1, 10)
+    assert stochastic.results.shape == (1, 10)
+    assert contextual.results.shape == (1, 1000)